@@ -1,24 +1,16 @@
 import dash
 from dash import Dash, html, dcc, Input, Output, dash_table
-import pandas as pd
 import os
 
+from filters import TABLE_COLUMNS, TABLE_FIELDS, extract_tokens, filter_rows, image_path, load_workbook
+
 
 # ---------------- App Initialization ----------------
 app = Dash(__name__)
 server = app.server
 
 # ---------------- Load Data ----------------
-df = pd.read_excel("2025-11-13_Workshop barrier summary.xlsx", sheet_name="Sheet1")
-
-def extract_tokens(cell):
-    if pd.isna(cell):
-        return []
-    return [
-        part.strip()
-        for part in str(cell).split(",")
-        if part.strip() != ""   # <-- removes blanks
-    ]
+df = load_workbook()
 
 # Build unique location list
 unique_locations = sorted({loc for cell in df["Location Identified"]
@@ -28,182 +20,119 @@ unique_stakeholders = sorted({token for cell in df["Filtering-Stakeholder-Catego
 
 
 # ---------------- Layout ----------------
-app.layout = html.Div([
-
-    # ---------------- Title ----------------
-    html.H1(
-        "Atlantic Housing Innovation Strategy",
-        style={
-            "textAlign": "left",
-            "margin": "20px",
-            "fontSize": "36px",
-            "fontWeight": "bold"
-        }
-    ),
-
-    # ---------------- Filters ----------------
-    html.Div([
-        html.H2("Filters", style={"margin-bottom": "20px"}),
-        dcc.Dropdown(
-            id="category-filter",
-            options=[{"label": c, "value": c} for c in sorted(df["Category"].unique())],
-            placeholder="Select Category",
-            multi=True,
-            style={"margin-bottom": "15px"}
-        ),
-        dcc.Dropdown(
-            id="subcategory-filter",
-            options=[{"label": sc, "value": sc} for sc in sorted(df["Sub-Category"].unique())],
-            placeholder="Select Subcategory",
-            multi=True,
-            style={"margin-bottom": "15px"}
-        ),
-        dcc.Dropdown(
-            id="location-filter",
-            options=[{"label": loc, "value": loc} for loc in unique_locations],
-            placeholder="Select Location Identified",
-            multi=True,
-            style={"margin-bottom": "15px"}
-        ),
-        dcc.Dropdown(
-            id="stakeholder-filter",
-            options=[{"label": s, "value": s} for s in unique_stakeholders],
-            placeholder="Select Stakeholder/Owner Category",
-            multi=True,
-            style={"margin-bottom": "20px"}
-        ),
+# Repeated styling lives in assets/style.css and dropdown options are filled
+# in by sync_all_filters on load. Both tab panes are part of the layout and
+# render_tab only shows/hides them, so switching tabs never rebuilds them.
+FILTER_DROPDOWNS = [
+    ("category-filter", "Select Category"),
+    ("subcategory-filter", "Select Subcategory"),
+    ("location-filter", "Select Location Identified"),
+    ("stakeholder-filter", "Select Stakeholder/Owner Category"),
+]
+
+
+def build_filters():
+    return html.Div([
+        html.H2("Filters", className="section-title"),
+        *[
+            dcc.Dropdown(
+                id=dropdown_id,
+                options=[],
+                placeholder=placeholder,
+                multi=True,
+                className="filter-dropdown"
+            )
+            for dropdown_id, placeholder in FILTER_DROPDOWNS
+        ],
         html.Button(
             "Reset Filters",
             id="reset-filters",
             n_clicks=0,
             className="reset-button"
         )
-    ], style={
-        "padding": "30px",
-        "margin": "20px",
-        "border-radius": "15px",
-        "box-shadow": "0 2px 5px rgba(0,0,0,0.1)",
-        "backgroundColor": "#f2f2f2",
-    }),
-
-    # ---------------- Tabs ----------------
-    dcc.Tabs([
-        # ---------------- Dashboard Tab ----------------
-        dcc.Tab(
-            label='Dashboard View',
-            children=[
-                html.Div([
-                    html.H2("Dashboards", style={"margin-bottom": "20px"}),
-                    html.Hr(),
-                    dcc.Loading(
-                    id="loading-images",
-                    type="circle",  # you can also use "dot" or "default"
-                    color="#444",   # spinner color (dark gray to match your theme)
-                    children=html.Div(id="image-container")
-                )
-                ], style={
-                    "padding": "30px",
-                    "margin": "20px",
-                    "border-radius": "15px",
-                    "box-shadow": "0 2px 5px rgba(0,0,0,0.1)"
-                })
-            ],
-            style={
+    ], className="card filter-panel")
+
+
+def build_dashboard_tab():
+    return html.Div([
+        html.H2("Dashboards", className="section-title"),
+        html.Hr(),
+        dcc.Loading(
+            id="loading-images",
+            type="circle",
+            color="#444",
+            children=html.Div(id="image-container")
+        )
+    ], className="card")
+
+
+def build_initiatives_tab():
+    return html.Div([
+        html.H2("Initiatives Overview", className="section-title section-title--large"),
+        dash_table.DataTable(
+            id='initiatives-table',
+            columns=TABLE_COLUMNS,
+            data=[],
+            page_action="native",
+            page_size=10,
+            style_table={"width": "100%", "overflowX": "hidden"},
+            style_cell={
                 "textAlign": "left",
-                "padding-left": "20px",
-                "font-weight": "bold",
-                "border-radius": "10px"
+                "padding": "10px",
+                "whiteSpace": "normal",
+                "height": "auto",
+                "wordBreak": "break-word"
             },
-            selected_style={
-                "textAlign": "left",
-                "padding-left": "20px",
-                "font-weight": "bold",
-                "color": "#000",
-                "border-radius": "10px"
-            }
-        ),
-        # ---------------- Initiatives Tab ----------------
-        dcc.Tab(
-            label='Initiatives View',
-            children=[
-                html.Div([
-                    html.H2(
-                        "Initiatives Overview",
-                        style={
-                            "margin-bottom": "20px",
-                            "textAlign": "left",
-                            "fontSize": "28px",
-                            "fontWeight": "bold"
-                        }
-                    ),
-                    dash_table.DataTable(
-                        id='initiatives-table',
-                        columns=[
-                            {"name": "ID", "id": "ID"},
-                            {"name": "Opportunities / Initiative", "id": "Opportunities/ Initiative"},
-                            {"name": "Category", "id": "Category"},
-                            {"name": "Location Identified", "id": "Location Identified"}
-                        ],
-                        data=[],
-                        page_action="native",
-                        page_size=10,
-                        style_table={
-                            "width": "100%",
-                            "margin": "0 auto",
-                            "overflowX": "hidden"
-                        },
-                        style_cell={
-                            "textAlign": "left",
-                            "padding": "10px",
-                            "whiteSpace": "normal",
-                            "height": "auto",
-                            "wordBreak": "break-word"
-                        },
-                        style_cell_conditional=[
-                            {"if": {"column_id": "ID"}, "width": "50px"},
-                            {"if": {"column_id": "Opportunities/ Initiative"}, "width": "400px"},
-                            {"if": {"column_id": "Category"}, "width": "150px"},
-                            {"if": {"column_id": "Location Identified"}, "width": "150px"},
-                            {"if": {"column_id": "Filtering-Stakeholder-Categories"}, "width": "200px"},
-                        ],
-                        style_header={
-                            "fontWeight": "bold",
-                            "textAlign": "left"
-                        }
-                    )
-                ], style={
-                    "padding": "30px",
-                    "margin": "20px",
-                    "border-radius": "15px",
-                    "box-shadow": "0 2px 5px rgba(0,0,0,0.1)"
-                })
+            style_cell_conditional=[
+                {"if": {"column_id": "ID"}, "width": "50px"},
+                {"if": {"column_id": "Opportunities/ Initiative"}, "width": "400px"},
+                {"if": {"column_id": "Category"}, "width": "150px"},
+                {"if": {"column_id": "Location Identified"}, "width": "150px"},
             ],
-            style={
-                "textAlign": "left",
-                "padding-left": "20px",
-                "font-weight": "bold",
-                "border-radius": "10px",
-            },
-            selected_style={
-                "textAlign": "left",
-                "padding-left": "20px",
-                "font-weight": "bold",
-                "color": "#000",
-                "border-radius": "10px"
-            }
+            style_header={"fontWeight": "bold", "textAlign": "left"}
         )
-    ],
-    style={
-        "margin-bottom": "20px",
-        "border-radius": "15px",
-        "overflow": "hidden",
-        "box-shadow": "0 2px 5px rgba(0,0,0,0.1)",
-        "margin": "20px"
-    })
-])
+    ], className="card")
+
+
+def build_layout():
+    return html.Div([
+        html.H1("Atlantic Housing Innovation Strategy", className="page-title"),
+        build_filters(),
+        dcc.Tabs(
+            id="view-tabs",
+            value="dashboard",
+            className="view-tabs",
+            children=[
+                dcc.Tab(label="Dashboard View", value="dashboard",
+                        className="view-tab", selected_className="view-tab--selected"),
+                dcc.Tab(label="Initiatives View", value="initiatives",
+                        className="view-tab", selected_className="view-tab--selected"),
+            ]
+        ),
+        html.Div(build_dashboard_tab(), id="dashboard-pane"),
+        html.Div(build_initiatives_tab(), id="initiatives-pane", className="tab-pane--hidden")
+    ])
+
+
+app.layout = build_layout()
 
 # ---------------- Callbacks ----------------
 
+# Show the selected tab
+@app.callback(
+    Output("dashboard-pane", "className"),
+    Output("initiatives-pane", "className"),
+    Input("view-tabs", "value"),
+    prevent_initial_call=True
+)
+def render_tab(tab):
+    hidden = "tab-pane--hidden"
+    return (
+        hidden if tab != "dashboard" else "",
+        hidden if tab != "initiatives" else ""
+    )
+
+
 # Category ↔ Subcategory dependent dropdowns
 @app.callback(
     Output("category-filter", "options"),
@@ -239,25 +168,8 @@ def sync_all_filters(selected_categories, selected_subcategories,
         )
 
     # ---- Standard SYNCHRONIZED logic ----
-    filtered = df.copy()
-
-    if selected_categories:
-        filtered = filtered[filtered["Category"].isin(selected_categories)]
-
-    if selected_subcategories:
-        filtered = filtered[filtered["Sub-Category"].isin(selected_subcategories)]
-
-    if selected_locations:
-        filtered = filtered[filtered["Location Identified"].apply(
-            lambda cell: any(loc in extract_tokens(cell)
-                             for loc in selected_locations)
-        )]
-
-    if selected_stakeholders:
-        filtered = filtered[filtered["Filtering-Stakeholder-Categories"].apply(
-            lambda cell: any(s in extract_tokens(cell)
-                             for s in selected_stakeholders)
-        )]
+    filtered = filter_rows(df, selected_categories, selected_subcategories,
+                           selected_locations, selected_stakeholders)
 
     # ---- Extract remaining valid values ----
     valid_categories = sorted(filtered["Category"].dropna().unique())
@@ -318,39 +230,18 @@ def update_dropdowns(selected_categories, selected_subcategories):
     Input("stakeholder-filter", "value")
 )
 def update_images(selected_categories, selected_subcategories, selected_locations, selected_stakeholders):
-    filtered = df.copy()
-
-    if selected_categories:
-        filtered = filtered[filtered["Category"].isin(selected_categories)]
-    if selected_subcategories:
-        filtered = filtered[filtered["Sub-Category"].isin(selected_subcategories)]
-    if selected_locations:
-        filtered = filtered[filtered["Location Identified"].apply(
-            lambda cell: any(
-                loc in extract_tokens(cell) for loc in selected_locations
-            )
-        )]
-    if selected_stakeholders:
-        filtered = filtered[filtered["Filtering-Stakeholder-Categories"].apply(
-            lambda cell: any(s in extract_tokens(cell) for s in selected_stakeholders)
-        )]
+    filtered = filter_rows(df, selected_categories, selected_subcategories,
+                           selected_locations, selected_stakeholders)
 
     if filtered.empty:
         return html.P("No images match your filters.")
 
     images = []
     for img_id in filtered["ID"]:
-        file_path = f"assets/{img_id}.png"
-        if os.path.exists(file_path):
+        if os.path.exists(image_path(img_id)):
             images.append(html.Img(
                 src=f"/assets/{img_id}.png",
-                style={
-                        "width": "70%",       # bigger image
-                        "margin-bottom": "20px",
-                        "display": "block",
-                        "margin-left": "auto",
-                        "margin-right": "auto"
-                    }
+                className="dashboard-image"
             ))
         else:
             images.append(html.P(f"Missing image: {img_id}.png"))
@@ -366,26 +257,10 @@ def update_images(selected_categories, selected_subcategories, selected_location
     Input("stakeholder-filter", "value")
 )
 def update_table(selected_categories, selected_subcategories, selected_locations, selected_stakeholders):
-    filtered = df.copy()
+    filtered = filter_rows(df, selected_categories, selected_subcategories,
+                           selected_locations, selected_stakeholders)
 
-    if selected_categories:
-        filtered = filtered[filtered["Category"].isin(selected_categories)]
-    if selected_subcategories:
-        filtered = filtered[filtered["Sub-Category"].isin(selected_subcategories)]
-    if selected_locations:
-        filtered = filtered[filtered["Location Identified"].apply(
-            lambda cell: any(
-                loc in extract_tokens(cell) for loc in selected_locations
-            )
-        )]
-    if selected_stakeholders:
-        filtered = filtered[filtered["Filtering-Stakeholder-Categories"].apply(
-            lambda cell: any(s in extract_tokens(cell) for s in selected_stakeholders)
-        )]
-
-    return filtered[
-    ["ID", "Opportunities/ Initiative", "Category", "Location Identified"]
-        ].to_dict("records")
+    return filtered[TABLE_FIELDS].to_dict("records")
 
 
 
@@ -0,0 +1,60 @@
+import os
+
+import pandas as pd
+
+
+# ---------------- Data Source ----------------
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+WORKBOOK_PATH = os.path.join(BASE_DIR, "2025-11-13_Workshop barrier summary.xlsx")
+ASSETS_DIR = os.path.join(BASE_DIR, "assets")
+
+# Initiatives table columns, shared by the dashboard and the batch reports
+TABLE_COLUMNS = [
+    {"name": "ID", "id": "ID"},
+    {"name": "Opportunities / Initiative", "id": "Opportunities/ Initiative"},
+    {"name": "Category", "id": "Category"},
+    {"name": "Location Identified", "id": "Location Identified"}
+]
+TABLE_FIELDS = [column["id"] for column in TABLE_COLUMNS]
+
+
+def load_workbook(path=WORKBOOK_PATH):
+    return pd.read_excel(path, sheet_name="Sheet1")
+
+
+def extract_tokens(cell):
+    if pd.isna(cell):
+        return []
+    return [
+        part.strip()
+        for part in str(cell).split(",")
+        if part.strip() != ""   # <-- removes blanks
+    ]
+
+
+# ---------------- Filter Engine ----------------
+# Shared by the Dash callbacks and the batch report generator (report.py)
+def filter_rows(df, selected_categories, selected_subcategories,
+                selected_locations, selected_stakeholders):
+    filtered = df.copy()
+
+    if selected_categories:
+        filtered = filtered[filtered["Category"].isin(selected_categories)]
+    if selected_subcategories:
+        filtered = filtered[filtered["Sub-Category"].isin(selected_subcategories)]
+    if selected_locations:
+        filtered = filtered[filtered["Location Identified"].apply(
+            lambda cell: any(
+                loc in extract_tokens(cell) for loc in selected_locations
+            )
+        )]
+    if selected_stakeholders:
+        filtered = filtered[filtered["Filtering-Stakeholder-Categories"].apply(
+            lambda cell: any(s in extract_tokens(cell) for s in selected_stakeholders)
+        )]
+
+    return filtered
+
+
+def image_path(img_id):
+    return os.path.join(ASSETS_DIR, f"{img_id}.png")
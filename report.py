@@ -0,0 +1,279 @@
+"""Headless batch report generator.
+
+Loads the workshop workbook once and renders one static HTML report per
+filter spec, using the same filter engine as the Dash app. Referenced
+images are copied into <out>/assets/, so the output folder is
+self-contained.
+
+    python report.py specs.json --out reports/ --workers 4
+
+A spec file is a list (or a mapping with a "reports" list) of entries:
+
+    [
+        {"name": "Policy and Regulatory in NS",
+         "categories": ["Policy and Regulatory"],
+         "locations": ["NS"]}
+    ]
+
+YAML spec files (.yaml/.yml) are also accepted if PyYAML is installed.
+
+Recognised keys are name, categories, subcategories, locations and
+stakeholders; any filter left out matches everything, as in the UI.
+"""
+import argparse
+import html
+import json
+import os
+import re
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from filters import (TABLE_COLUMNS, TABLE_FIELDS, extract_tokens, filter_rows, image_path,
+                     load_workbook, WORKBOOK_PATH)
+
+
+FILTER_KEYS = ["categories", "subcategories", "locations", "stakeholders"]
+
+# ---------------- Report Template ----------------
+# Print rules keep each image on a single page so "Save as PDF" works cleanly
+REPORT_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+    body {{ font-family: "Segoe UI", Arial, sans-serif; margin: 40px; }}
+    h1 {{ font-size: 32px; }}
+    .filters {{ background-color: #f2f2f2; padding: 15px 20px; border-radius: 10px; }}
+    table {{ width: 100%; border-collapse: collapse; margin-bottom: 30px; }}
+    th, td {{ text-align: left; padding: 10px; border-bottom: 1px solid #ced4da;
+              word-break: break-word; vertical-align: top; }}
+    th {{ font-weight: bold; }}
+    img {{ width: 70%; display: block; margin: 0 auto 20px; }}
+    @page {{ size: A4; margin: 15mm; }}
+    @media print {{
+        body {{ margin: 0; }}
+        figure, tr {{ page-break-inside: avoid; }}
+    }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<div class="filters">{filters}</div>
+<h2>Initiatives ({count})</h2>
+{table}
+<h2>Dashboards</h2>
+{images}
+</body>
+</html>
+"""
+
+
+# ---------------- Spec Loading ----------------
+def load_specs(path):
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise SystemExit("PyYAML is required for YAML spec files (pip install pyyaml)")
+            specs = yaml.safe_load(f)
+        else:
+            specs = json.load(f)
+
+    if isinstance(specs, dict):
+        specs = specs.get("reports", [])
+    if not isinstance(specs, list):
+        raise SystemExit(f"{path}: expected a list of report specs")
+
+    filenames = set()
+    for i, spec in enumerate(specs):
+        label = f"{path}: spec #{i + 1}"
+        if not isinstance(spec, dict):
+            raise SystemExit(f"{label} is not a mapping")
+
+        # A misspelled filter would otherwise match every initiative
+        unknown = set(spec) - {"name", *FILTER_KEYS}
+        if unknown:
+            raise SystemExit(f"{label} has unknown key(s): {', '.join(sorted(map(str, unknown)))} "
+                             f"(expected name, {', '.join(FILTER_KEYS)})")
+
+        spec.setdefault("name", f"report-{i + 1}")
+        if not isinstance(spec["name"], str) or not spec["name"].strip():
+            raise SystemExit(f"{label}: name must be a non-empty string")
+
+        for key in FILTER_KEYS:
+            value = spec.get(key)
+            # Allow a bare string for single-value filters
+            if isinstance(value, str):
+                value = [value]
+            if value is not None and not (
+                isinstance(value, list) and all(isinstance(v, str) for v in value)
+            ):
+                raise SystemExit(f"{label}: {key} must be a string or a list of strings")
+            spec[key] = value
+
+        # Names that slugify alike get -2, -3, ... so reports never overwrite each other
+        base = slugify(spec["name"])
+        filename, n = f"{base}.html", 1
+        while filename in filenames:
+            n += 1
+            filename = f"{base}-{n}.html"
+        filenames.add(filename)
+        spec["filename"] = filename
+    return specs
+
+
+def check_filter_values(specs, frame, path):
+    # The UI dropdowns only offer values that exist; a typo here would match nothing
+    known = {
+        "categories": set(frame["Category"].dropna()),
+        "subcategories": set(frame["Sub-Category"].dropna()),
+        "locations": {loc for cell in frame["Location Identified"]
+                      for loc in extract_tokens(cell)},
+        "stakeholders": {s for cell in frame["Filtering-Stakeholder-Categories"]
+                         for s in extract_tokens(cell)},
+    }
+
+    errors = []
+    for i, spec in enumerate(specs):
+        for key in FILTER_KEYS:
+            unknown = [value for value in spec[key] or [] if value not in known[key]]
+            if unknown:
+                errors.append(f"{path}: spec #{i + 1} has unknown {key}: "
+                              f"{', '.join(map(repr, unknown))}")
+    if errors:
+        raise SystemExit("\n".join(errors))
+
+
+def slugify(name):
+    return re.sub(r"[^A-Za-z0-9]+", "-", name).strip("-").lower() or "report"
+
+
+# ---------------- Rendering ----------------
+def render_table(filtered):
+    if filtered.empty:
+        return "<p>No initiatives match these filters.</p>"
+
+    header = "".join(f"<th>{html.escape(column['name'])}</th>" for column in TABLE_COLUMNS)
+    rows = []
+    for record in filtered[TABLE_FIELDS].to_dict("records"):
+        cells = "".join(
+            f"<td>{html.escape('' if value != value else str(value))}</td>"  # NaN -> blank
+            for value in record.values()
+        )
+        rows.append(f"<tr>{cells}</tr>")
+    return f"<table><thead><tr>{header}</tr></thead><tbody>{''.join(rows)}</tbody></table>"
+
+
+def is_same_file(source, target):
+    # copy2 preserves mtime, so an unchanged source matches its earlier copy
+    if not os.path.exists(target):
+        return False
+    src_stat, dst_stat = os.stat(source), os.stat(target)
+    return src_stat.st_size == dst_stat.st_size and src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+
+
+def copy_asset(file_path, out_dir):
+    # Reports reference their own copy so the output folder can be moved or shared
+    assets_dir = os.path.join(out_dir, "assets")
+    os.makedirs(assets_dir, exist_ok=True)
+    target = os.path.join(assets_dir, os.path.basename(file_path))
+    if not is_same_file(file_path, target):
+        # Workers may copy the same image at once; write then rename atomically
+        tmp_path = f"{target}.{os.getpid()}.tmp"
+        shutil.copy2(file_path, tmp_path)
+        os.replace(tmp_path, target)
+    return f"assets/{os.path.basename(file_path)}"
+
+
+def render_images(filtered, out_dir):
+    if filtered.empty:
+        return "<p>No images match these filters.</p>"
+
+    images = []
+    for img_id in filtered["ID"]:
+        file_path = image_path(img_id)
+        if os.path.exists(file_path):
+            src = copy_asset(file_path, out_dir)
+            images.append(
+                f'<figure><img src="{html.escape(src)}" alt="{html.escape(str(img_id))}"></figure>'
+            )
+        else:
+            images.append(f"<p>Missing image: {html.escape(str(img_id))}.png</p>")
+    return "\n".join(images)
+
+
+def render_filters(spec):
+    parts = [
+        f"<strong>{key.capitalize()}:</strong> {html.escape(', '.join(spec[key]))}"
+        for key in FILTER_KEYS
+        if spec[key]
+    ]
+    return "<br>".join(parts) or "No filters applied."
+
+
+# ---------------- Workers ----------------
+df = None
+
+
+def init_worker(frame):
+    # Each worker receives the workbook once instead of re-reading it per spec
+    global df
+    df = frame
+
+
+def build_report(spec, out_dir):
+    filtered = filter_rows(df, *(spec[key] for key in FILTER_KEYS))
+
+    page = REPORT_TEMPLATE.format(
+        title=html.escape(spec["name"]),
+        filters=render_filters(spec),
+        count=len(filtered),
+        table=render_table(filtered),
+        images=render_images(filtered, out_dir),
+    )
+
+    out_path = os.path.join(out_dir, spec["filename"])
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(page)
+    return out_path, len(filtered)
+
+
+# ---------------- CLI ----------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate static initiative reports from filter specs.")
+    parser.add_argument("specs", help="JSON (or YAML, with PyYAML) file with a list of filter specs")
+    parser.add_argument("--out", default="reports", help="output directory (default: reports)")
+    parser.add_argument("--workbook", default=WORKBOOK_PATH, help="workshop workbook to read")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    specs = load_specs(args.specs)
+    os.makedirs(args.out, exist_ok=True)
+    out_dir = os.path.abspath(args.out)
+
+    frame = load_workbook(args.workbook)
+    check_filter_values(specs, frame, args.specs)
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers,
+                             initializer=init_worker, initargs=(frame,)) as pool:
+        futures = [pool.submit(build_report, spec, out_dir) for spec in specs]
+        for spec, future in zip(specs, futures):
+            # One bad spec should not stop the rest of the batch
+            try:
+                out_path, count = future.result()
+            except Exception as exc:
+                failed += 1
+                print(f"{spec['name']}: FAILED ({type(exc).__name__}: {exc})", file=sys.stderr)
+                continue
+            print(f"{spec['name']}: {count} initiatives -> {out_path}")
+
+    if failed:
+        raise SystemExit(f"{failed} of {len(specs)} reports failed")
+
+
+if __name__ == "__main__":
+    main()